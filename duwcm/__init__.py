@@ -3,7 +3,6 @@
 # Import main components
 from .water_model import UrbanWaterModel
 from .water_balance import run_water_balance
-from .plots import plot_all
 
 # Import subpackages
 from . import functions
@@ -18,6 +17,13 @@ __all__ = [
     "UrbanWaterModel"
 ]
 
+def __getattr__(name):
+    # plot_all pulls in the whole plotting stack, so it is only imported on first use
+    if name == "plot_all":
+        from .plots import plot_all
+        return plot_all
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # Package metadata
 __author__ = "Ricardo"
 __email__ = "ricardo.reyes@eawag.ch"
@@ -1,34 +1,38 @@
 import logging
+import numpy as np
+import pandas as pd
 from duwcm.diagnostics import DiagnosticTracker
 
 logger = logging.getLogger(__name__)
 def alert(tracker: DiagnosticTracker) -> None:
     """Alert if there are significant diagnostic issues."""
-    if not tracker:
+    if not tracker or not logger.isEnabledFor(logging.WARNING):
         return
 
     results = tracker.get_results()
 
     # Check water balance
     balance_df = results['balance']
-    errors = balance_df[abs(balance_df['balance_error_percent']) > 1.0]
-    if not errors.empty:
-        for comp in errors['component'].unique():
-            comp_errors = errors[errors['component'] == comp]
+    abs_error = np.fabs(balance_df['balance_error_percent'].to_numpy())
+    significant = abs_error > 1.0
+    if significant.any():
+        errors = pd.DataFrame({'component': balance_df['component'].to_numpy()[significant],
+                               'abs_error': abs_error[significant]})
+        by_component = errors.groupby('component', sort=False)['abs_error'].agg(['size', 'max'])
+        for comp, count, max_error in by_component.itertuples():
             logger.warning("%d balance errors in %s component (max error: %.2f%%)",
-                         len(comp_errors), comp,
-                         comp_errors['balance_error_percent'].abs().max())
+                         count, comp, max_error)
 
     # Check flow connections
     flows_df = results['flows']
     if not flows_df.empty:
-        for issue_type in flows_df['issue_type'].unique():
-            count = len(flows_df[flows_df['issue_type'] == issue_type])
+        issue_types, counts = np.unique(flows_df['issue_type'].to_numpy(), return_counts=True)
+        for issue_type, count in zip(issue_types, counts):
             logger.warning("%d %s flow issues", count, issue_type)
 
     # Check storage violations
     storage_df = results['storage']
     if not storage_df.empty:
-        for issue_type in storage_df['issue_type'].unique():
-            issues = storage_df[storage_df['issue_type'] == issue_type]
-            logger.warning("%d storage %s violations", len(issues), issue_type)
+        issue_types, counts = np.unique(storage_df['issue_type'].to_numpy(), return_counts=True)
+        for issue_type, count in zip(issue_types, counts):
+            logger.warning("%d storage %s violations", count, issue_type)
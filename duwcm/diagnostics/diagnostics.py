@@ -9,6 +9,7 @@ This module provides comprehensive diagnostic and checking capabilities:
 """
 from typing import Dict, Optional
 from pathlib import Path
+import numpy as np
 import pandas as pd
 from duwcm.water_model import UrbanWaterModel
 from duwcm.data_structures import Storage
@@ -66,7 +67,7 @@ class DiagnosticTracker:
                 summary.to_csv(output_dir / 'balance_summary.csv')
 
                 # Save violations (errors > 1%)
-                violations = df[abs(df['balance_error_percent']) > 1.0]
+                violations = df[np.fabs(df['balance_error_percent'].to_numpy()) > 1.0]
                 if not violations.empty:
                     violations.to_csv(output_dir / 'balance_violations.csv')
 
@@ -325,27 +326,27 @@ class DiagnosticTracker:
         flow_matrix = pd.DataFrame(0.0, index=all_nodes, columns=all_nodes)
 
         # Process each flow type
-        for _, flow in detailed_flows.iterrows():
-            src, dest, amount = None, None, flow['amount']
-            if flow['flow_type'] == 'inflow':
-                if flow['flow_name'] in {'precipitation', 'imported_water'}:
-                    src, dest = flow['flow_name'], flow['component']
-                elif flow['component'] == 'sewerage' and flow['flow_name'] == 'from_upstream':
-                    flow_matrix.loc['sewerage_upstream', 'sewerage'] += flow['amount']
-                elif flow['component'] == 'stormwater' and flow['flow_name'] == 'from_upstream':
-                    flow_matrix.loc['runoff_upstream', 'stormwater'] += flow['amount']
-                elif flow['flow_name'].startswith('from_'):
-                    src = flow['flow_name'].replace('from_', '')
-                    dest = flow['component'] if src in components else None
-
-            elif flow['flow_type'] == 'outflow':
-                if flow['flow_name'] in {'evaporation', 'transpiration'}:
-                    dest = flow['flow_name']
-                    src = flow['component']
-                elif flow['component'] == 'sewerage' and flow['flow_name'] == 'to_downstream':
-                    flow_matrix.loc['sewerage', 'discharge'] += flow['amount']
-                elif flow['component'] == 'stormwater' and flow['flow_name'] == 'to_downstream':
-                    flow_matrix.loc['stormwater', 'runoff'] += flow['amount']
+        for flow in detailed_flows[['flow_type', 'flow_name', 'component', 'amount']].itertuples(index=False):
+            src, dest, amount = None, None, flow.amount
+            if flow.flow_type == 'inflow':
+                if flow.flow_name in {'precipitation', 'imported_water'}:
+                    src, dest = flow.flow_name, flow.component
+                elif flow.component == 'sewerage' and flow.flow_name == 'from_upstream':
+                    flow_matrix.loc['sewerage_upstream', 'sewerage'] += flow.amount
+                elif flow.component == 'stormwater' and flow.flow_name == 'from_upstream':
+                    flow_matrix.loc['runoff_upstream', 'stormwater'] += flow.amount
+                elif flow.flow_name.startswith('from_'):
+                    src = flow.flow_name.replace('from_', '')
+                    dest = flow.component if src in components else None
+
+            elif flow.flow_type == 'outflow':
+                if flow.flow_name in {'evaporation', 'transpiration'}:
+                    dest = flow.flow_name
+                    src = flow.component
+                elif flow.component == 'sewerage' and flow.flow_name == 'to_downstream':
+                    flow_matrix.loc['sewerage', 'discharge'] += flow.amount
+                elif flow.component == 'stormwater' and flow.flow_name == 'to_downstream':
+                    flow_matrix.loc['stormwater', 'runoff'] += flow.amount
 
             if src and dest:
                 flow_matrix.loc[src, dest] += amount
@@ -421,24 +422,24 @@ class DiagnosticTracker:
             flow_matrix.loc['storage', f'cell_{cell_id}'] = abs(net_storage_change)
 
         # Process other flows
-        for _, flow in detailed_flows.iterrows():
-            if flow['flow_type'] == 'inflow':
-                if flow['flow_name'] == 'precipitation':
-                    flow_matrix.loc['precipitation', f'cell_{cell_id}'] += flow['amount']
-                elif flow['flow_name'] == 'imported_water':
-                    flow_matrix.loc['imported_water', f'cell_{cell_id}'] += flow['amount']
-                elif flow['component'] == 'sewerage' and 'upstream' in flow['flow_name']:
-                    flow_matrix.loc['sewerage_upstream', f'cell_{cell_id}'] += flow['amount']
-                elif flow['component'] == 'stormwater' and 'upstream' in flow['flow_name']:
-                    flow_matrix.loc['runoff_upstream', f'cell_{cell_id}'] += flow['amount']
-
-            elif flow['flow_type'] == 'outflow':
-                if flow['flow_name'] in ['evaporation', 'transpiration']:
-                    flow_matrix.loc[f'cell_{cell_id}', 'evapotranspiration'] += flow['amount']
-                elif flow['component'] == 'sewerage' and flow['flow_name'] == 'to_downstream':
-                    flow_matrix.loc[f'cell_{cell_id}', 'sewerage_downstream'] += flow['amount']
-                elif flow['component'] == 'stormwater' and flow['flow_name'] == 'to_downstream':
-                    flow_matrix.loc[f'cell_{cell_id}', 'runoff_downstream'] += flow['amount']
+        for flow in detailed_flows[['flow_type', 'flow_name', 'component', 'amount']].itertuples(index=False):
+            if flow.flow_type == 'inflow':
+                if flow.flow_name == 'precipitation':
+                    flow_matrix.loc['precipitation', f'cell_{cell_id}'] += flow.amount
+                elif flow.flow_name == 'imported_water':
+                    flow_matrix.loc['imported_water', f'cell_{cell_id}'] += flow.amount
+                elif flow.component == 'sewerage' and 'upstream' in flow.flow_name:
+                    flow_matrix.loc['sewerage_upstream', f'cell_{cell_id}'] += flow.amount
+                elif flow.component == 'stormwater' and 'upstream' in flow.flow_name:
+                    flow_matrix.loc['runoff_upstream', f'cell_{cell_id}'] += flow.amount
+
+            elif flow.flow_type == 'outflow':
+                if flow.flow_name in ['evaporation', 'transpiration']:
+                    flow_matrix.loc[f'cell_{cell_id}', 'evapotranspiration'] += flow.amount
+                elif flow.component == 'sewerage' and flow.flow_name == 'to_downstream':
+                    flow_matrix.loc[f'cell_{cell_id}', 'sewerage_downstream'] += flow.amount
+                elif flow.component == 'stormwater' and flow.flow_name == 'to_downstream':
+                    flow_matrix.loc[f'cell_{cell_id}', 'runoff_downstream'] += flow.amount
 
         # Set seepage direction
         if net_seepage > 0:
@@ -1,23 +1,25 @@
-from typing import List
+from typing import Iterable
+import numpy as np
 import pandas as pd
 
-def select_cells(model_params: dict, flow_paths: pd.DataFrame, selected_cells: List[int]) -> tuple:
+def select_cells(model_params: dict, flow_paths: pd.DataFrame, selected_cells: Iterable[int]) -> tuple:
     """Filter model parameters and flow paths to selected cells.
 
     Args:
         model_params: Original model parameters dictionary
         flow_paths: Original flow paths DataFrame
-        selected_cells: List of cell IDs to select
+        selected_cells: Iterable of cell IDs to select
 
     Returns:
         Tuple of (filtered_params, filtered_paths)
     """
-    filtered_params = {k: v for k, v in model_params.items() if k in selected_cells}
+    # Array for the vectorized isin masks, set for the per-key dict lookups
+    selected = np.fromiter(selected_cells, dtype=np.int64)
+    selected_set = set(selected.tolist())
 
-    filtered_paths = flow_paths.loc[flow_paths.index.isin(selected_cells)].copy()
-    for col in filtered_paths.columns:
-        if col != 'down':
-            filtered_paths[col] = filtered_paths[col].apply(lambda x: x if x in selected_cells else 0)
-    filtered_paths['down'] = filtered_paths['down'].apply(lambda x: x if x in selected_cells else 0)
+    filtered_params = {k: v for k, v in model_params.items() if k in selected_set}
+
+    filtered_paths = flow_paths.loc[flow_paths.index.isin(selected)]
+    filtered_paths = filtered_paths.where(filtered_paths.isin(selected), 0)
 
     return filtered_params, filtered_paths
@@ -1,29 +1,30 @@
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Set, Tuple, Any
 from pathlib import Path
+import os
 import argparse
 import logging
-from joblib import Parallel, delayed
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from joblib import cpu_count, effective_n_jobs
+from joblib.externals.loky import ProcessPoolExecutor
 
 from duwcm.read_data import read_data
 from duwcm.forcing import read_forcing
 from duwcm.scenario_manager import ScenarioManager, run_scenario
 
 from duwcm.water_model import UrbanWaterModel
-from duwcm.initialization import initialize_model
 from duwcm.summary import write_summary
-from duwcm.utils import load_config
+from duwcm.utils import load_config, save_results
 from duwcm.functions import select_cells
+from duwcm.postprocess import calculate_flow_matrix, calculate_reuse_flow_matrix
 from duwcm.diagnostics import DiagnosticTracker, alert, generate_alluvial_cells
-from duwcm.plots import (export_geodata, generate_plots, generate_maps,
-                         generate_system_maps, generate_chord, generate_graph,
-                         generate_alluvial_total, generate_alluvial_reuse
-                         )
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s',
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(processName)s - %(levelname)s - %(message)s',
                     datefmt='%H:%M:%S')
 logger = logging.getLogger(__name__)
 
+# Output directories already created in this process
+_created_dirs: Set[Path] = set()
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Run Urban Water Model")
     parser.add_argument("--config", required=True, help="Path to the configuration files")
@@ -33,10 +34,18 @@ def main() -> None:
     parser.add_argument("--check", action="store_true", help="Check water balance")
     parser.add_argument("--scenarios", action="store_true", help="Run multiple scenarios")
     parser.add_argument("--save", action="store_true", help="Save results")
+    parser.add_argument("--format", choices=["h5", "parquet"], default="h5",
+                        help="File format for saved results")
+    parser.add_argument("--summary", action="store_true", help="Write water balance summary")
     parser.add_argument("--initialize", action="store_true", help="Run model initialization only")
-    parser.add_argument("--n-jobs", type=int, default=-1, help="Number of parallel jobs")
+    parser.add_argument("--n-jobs", type=int, default=-1,
+                        help="Number of parallel jobs (-1 uses all physical cores)")
     args = parser.parse_args()
 
+    # Hyperthreads add little to numpy-bound workers, so default to physical cores
+    if args.n_jobs == -1:
+        args.n_jobs = cpu_count(only_physical_cores=True)
+
     logger.info("Distributed Urban Water Balance Model")
 
     if args.check:
@@ -49,18 +58,28 @@ def main() -> None:
     base_config = load_config(args.config, args.env, "config.yaml")
     model_params, reuse_settings, demand_data, soil_data, et_data, flow_paths = read_data(base_config)
     forcing_data = read_forcing(base_config)
+
+    # Settings used throughout the run are resolved once
+    direction = base_config.grid.direction
+    selected_cells = getattr(base_config.grid, 'selected_cells', None)
+    if selected_cells is not None:
+        selected_cells = frozenset(map(int, selected_cells))
+    out_base = Path(base_config.output.directory)
+
     logger.info("Number of grid cells: %d", len(model_params))
-    logger.info("Simulation period: %s to %s",
-             forcing_data.index[0].strftime('%Y-%m-%d'),
-             forcing_data.index[-1].strftime('%Y-%m-%d'))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Simulation period: %s to %s",
+                 forcing_data.index[0].strftime('%Y-%m-%d'),
+                 forcing_data.index[-1].strftime('%Y-%m-%d'))
 
     # Filter selected cells if specified
-    selected_cells = getattr(base_config.grid, 'selected_cells', None)
     if selected_cells is not None:
         model_params, flow_paths = select_cells(model_params, flow_paths, selected_cells)
         logger.info("Filtered to %d selected cells", len(model_params))
 
     if args.initialize:
+        from duwcm.initialization import initialize_model
+
         model = UrbanWaterModel(
             params=model_params,
             path=flow_paths,
@@ -68,15 +87,15 @@ def main() -> None:
             et_data=et_data,
             demand_settings=demand_data,
             reuse_settings=reuse_settings,
-            direction=base_config.grid.direction
+            direction=direction
         )
         initialize_model(model, forcing_data, base_config)
         logger.info("Model initialization completed")
         return
 
     if args.scenarios:
-        # Load base and scenario configs separately
-        scenario_config = load_config(args.config, args.env, "scenarios.yaml")
+        # Overlay the scenario definitions onto a copy of the loaded base config
+        scenario_config = load_config(args.config, args.env, "scenarios.yaml", settings=base_config)
 
         scenario_manager = ScenarioManager.from_config(scenario_config)
 
@@ -87,29 +106,57 @@ def main() -> None:
             'et_data': et_data,
             'demand_data': demand_data,
             'reuse_settings': reuse_settings,
-            'direction': base_config.grid.direction
+            'direction': direction
         }
 
-        # Run all cases
-        all_results = scenario_manager.run_scenarios(
+        # Paths shared by all cases are resolved once
+        geo_paths = _geo_paths(base_config) if args.plot or args.gis else None
+
+        # Run all cases. Each finished case is handed to an output worker process,
+        # so its outputs are written while the remaining cases are still simulating.
+        # At most one case per output worker is in flight, bounding memory use.
+        # Simulation and output workers run at the same time, so the --n-jobs budget
+        # is split between them. With --check, iter_scenarios yields only once all
+        # cases have finished, so both phases can use the full budget.
+        n_jobs = effective_n_jobs(args.n_jobs)
+        if tracker is None:
+            output_workers = max(1, n_jobs // 2)
+            simulation_jobs = max(1, n_jobs - output_workers)
+        else:
+            output_workers = simulation_jobs = n_jobs
+
+        cases = scenario_manager.iter_scenarios(
             model_data=model_data,
             base_params=model_params,
             base_forcing=forcing_data,
             tracker = tracker,
-            n_jobs=args.n_jobs
+            n_jobs=simulation_jobs
         )
 
-        Parallel(n_jobs=args.n_jobs, backend='loky', verbose=0)(
-            delayed(process_outputs)(
-                results,
-                tracker,
-                flow_paths,
-                Path(base_config.output.directory) / case_name,
-                base_config,
-                args
-            )
-            for case_name, results in all_results.items()
-        )
+        output_futures = set()
+        single_thread = {var: '1' for var in ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS')}
+        with ProcessPoolExecutor(max_workers=output_workers, env=single_thread) as output_executor:
+            for case_name, results in cases:
+                if len(output_futures) >= output_workers:
+                    done, output_futures = wait(output_futures, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+
+                output_futures.add(output_executor.submit(
+                    process_outputs,
+                    results,
+                    tracker,
+                    flow_paths,
+                    out_base / case_name,
+                    base_config,
+                    args,
+                    geo_paths
+                ))
+                del results
+
+            # Propagate any exception raised in an output worker
+            for future in output_futures:
+                future.result()
 
     else:
         # Single base case
@@ -119,94 +166,131 @@ def main() -> None:
             'et_data': et_data,
             'demand_data': demand_data,
             'reuse_settings': reuse_settings,
-            'direction': base_config.grid.direction
+            'direction': direction
         }, tracker, None, True)
         _, results = run_scenario(scenario_data)
 
-        out_base = Path(base_config.output.directory) / args.env
-        process_outputs(results, tracker, flow_paths, out_base, base_config, args)
+        process_outputs(results, tracker, flow_paths, out_base / args.env, base_config, args)
 
     logger.info("Simulation completed")
 
 
-def process_outputs(results, tracker, flow_paths, output_dir, config, args):
+def _ensure_dir(directory: Path) -> None:
+    """Create an output directory once per process"""
+    if directory not in _created_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _created_dirs.add(directory)
+
+def _geo_paths(config) -> Dict[str, Any]:
+    """Resolve the geometry and shapefile paths used by the map outputs"""
+    geo_dir = Path(config.geodata_directory)
+    return {
+        'geo_file': Path(config.input_directory) / config.files.geo,
+        'background_shapefile': geo_dir / config.files.background_shapefile,
+        'feature_shapefiles': [geo_dir / shapefile for shapefile in config.files.feature_shapefiles]
+    }
+
+def process_outputs(results, tracker, flow_paths, output_dir, config, args, geo_paths=None):
     """Process and save outputs based on arguments"""
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-    # Generate plots
+    if not (args.plot or args.gis or args.check or args.save or args.summary):
+        return
+
+    _ensure_dir(output_dir)
+    if geo_paths is None and (args.plot or args.gis):
+        geo_paths = _geo_paths(config)
+
+    geo = geo_paths or {}
+    gis_dir = output_dir / 'gis'
+
+    # The flow matrices are computed once and shared by the flow diagrams and the summary
+    flow_matrix = reuse_matrix = None
+    if args.plot or args.check or args.save or args.summary:
+        flow_matrix = calculate_flow_matrix(results, flow_paths)
     if args.plot:
-        plot_dir = output_dir / 'figures'
-        map_dir = output_dir / 'maps'
-        flow_dir = output_dir / 'flows'
-        for directory in [plot_dir, map_dir, flow_dir]:
-            directory.mkdir(parents=True, exist_ok=True)
-
-        generate_plots(results['aggregated'],
-                       results['forcing'],
-                       plot_dir)
-
-        geo_dir = Path(config.geodata_directory)
-        geo_file = Path(config.input_directory) / Path(config.files.geo)
-        background_shapefile = geo_dir / config.files.background_shapefile
-        feature_shapefiles = [geo_dir / shapefile for shapefile in config.files.feature_shapefiles]
-
-        generate_system_maps(
-            background_shapefile = background_shapefile,
-            feature_shapefiles = feature_shapefiles,
-            geometry_geopackage = geo_file,
-            output_dir = map_dir,
-            flow_paths = flow_paths,
-            config = config
-            )
-        generate_maps(
-            background_shapefile = background_shapefile,
-            feature_shapefiles = feature_shapefiles,
-            geometry_geopackage = geo_file,
-            results = results,
-            output_dir = map_dir,
-            flow_paths = flow_paths
-        )
+        reuse_matrix = calculate_reuse_flow_matrix(results)
+
+    # Output generators as (flag, subdirectory, function name, kwargs, threaded).
+    # Plotly/kaleido and GIS exports do not touch pyplot state, so they run in
+    # worker threads while the matplotlib figures are drawn in this thread.
+    output_tasks = [
+        ('gis', 'gis', 'export_geodata', {
+            'geometry_geopackage': geo.get('geo_file'),
+            'results': results,
+            'forcing': results['forcing'],
+            'crs': config.output.get('crs'),
+            'file_format': 'gpkg'
+        }, True),
+        ('plot', 'flows', 'generate_alluvial_total', {
+            'results': results,
+            'flow_paths': flow_paths,
+            'flow_matrix': flow_matrix
+        }, True),
+        ('plot', 'flows', 'generate_alluvial_reuse', {
+            'results': results,
+            'reuse_matrix': reuse_matrix
+        }, True),
+        ('plot', 'figures', 'generate_plots', {
+            'results': results['aggregated'],
+            'forcing': results['forcing']
+        }, False),
+        ('plot', 'maps', 'generate_system_maps', {
+            'background_shapefile': geo.get('background_shapefile'),
+            'feature_shapefiles': geo.get('feature_shapefiles'),
+            'geometry_geopackage': geo.get('geo_file'),
+            'flow_paths': flow_paths,
+            'config': config
+        }, False),
+        ('plot', 'maps', 'generate_maps', {
+            'background_shapefile': geo.get('background_shapefile'),
+            'feature_shapefiles': geo.get('feature_shapefiles'),
+            'geometry_geopackage': geo.get('geo_file'),
+            'results': results,
+            'flow_paths': flow_paths,
+            # Scenario outputs already run in worker processes
+            'n_jobs': 1 if args.scenarios else args.n_jobs
+        }, False),
+        ('plot', 'flows', 'generate_chord', {
+            'results': results,
+            'flow_paths': flow_paths,
+            'flow_matrix': flow_matrix,
+            'reuse_matrix': reuse_matrix
+        }, False),
+        ('plot', 'flows', 'generate_graph', {
+            'results': results,
+            'flow_paths': flow_paths,
+            'flow_matrix': flow_matrix
+        }, False),
+    ]
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = []
+        for flag, subdir, name, kwargs, threaded in output_tasks:
+            if not getattr(args, flag):
+                continue
+            # Plotting and GIS stacks are only imported once an output needs them
+            from duwcm import plots
+            function = getattr(plots, name)
+            task_dir = output_dir / subdir
+            _ensure_dir(task_dir)
+            if threaded:
+                futures.append(executor.submit(function, output_dir=task_dir, **kwargs))
+            else:
+                function(output_dir=task_dir, **kwargs)
+
+        # Propagate any exception raised in a worker
+        for future in futures:
+            future.result()
 
-        # Generate flow diagrams
-        generate_chord(
-            results = results,
-            flow_paths = flow_paths,
-            output_dir=flow_dir
-        )
-        generate_graph(
-            results = results,
-            flow_paths = flow_paths,
-            output_dir=flow_dir
-        )
-        generate_alluvial_total(
-            results = results,
-            flow_paths = flow_paths,
-            output_dir=flow_dir
-        )
-        generate_alluvial_reuse(
-            results = results,
-            output_dir=flow_dir
-        )
+    if args.plot:
         logger.info("Plots saved to %s", output_dir)
-
     if args.gis:
-        gis_dir = output_dir / 'gis'
-        gis_dir.mkdir(parents=True, exist_ok=True)
-        geo_file = Path(config.input_directory) / Path(config.files.geo)
-        export_geodata(
-            geometry_geopackage = geo_file,
-            results = results,
-            forcing = results['forcing'],
-            output_dir = gis_dir,
-            crs = config.output.crs,
-            file_format = 'gpkg'
-        )
         logger.info("Geodata saved to %s", gis_dir)
 
     # Check results and save water balance
     if args.check:
         check_dir = output_dir / 'diagnostic'
-        check_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(check_dir)
         tracker.generate_report(check_dir)
         alert(tracker)
 
@@ -223,26 +307,20 @@ def process_outputs(results, tracker, flow_paths, output_dir, config, args):
         #print_summary(results)
 
     if args.save:
-        save_dir = output_dir / 'simulation_results.h5'
-
-        with pd.HDFStore(save_dir, mode='w') as store:
-            for module, df in results.items():
-                units_dict = {col: str(df[col].pint.units) for col in df.columns if hasattr(df[col], "pint")}
-
-                # Convert Pint DataFrame to a regular Pandas DataFrame
-                df_regular = df.copy()
-                for col in units_dict.keys():
-                    df_regular[col] = df[col].pint.magnitude
-
-                # Save DataFrame to HDF5
-                store.put(module, df_regular, format='table', data_columns=True)
-                if units_dict:
-                    store.get_storer(module).attrs.units = units_dict
-
+        if args.format == 'parquet':
+            save_dir = output_dir / 'simulation_results'
+        else:
+            save_dir = output_dir / 'simulation_results.h5'
+
+        # Scenario outputs are saved by several worker processes at once
+        save_results(results, save_dir, file_format=args.format,
+                     float32=config.output.get('float32', False),
+                     n_threads=1 if args.scenarios else args.n_jobs)
         logger.info("Results and forcing data saved to %s", save_dir)
 
-    summary_dir = output_dir / 'summary.txt'
-    write_summary(results, flow_paths, summary_dir)
+    if args.summary or args.save or args.check:
+        summary_dir = output_dir / 'summary.txt'
+        write_summary(results, flow_paths, summary_dir, flow_matrix=flow_matrix)
 
 if __name__ == "__main__":
     main()
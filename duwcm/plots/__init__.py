@@ -1,16 +1,36 @@
 # duwcm/plots/__init__.py
 
-from .export_geodata import export_geodata
-from .generate_plots import generate_plots
-from .generate_maps import generate_maps, generate_system_maps
-from .generate_chord import generate_chord
-from .generate_alluvial import (
-    generate_alluvial,
-    generate_alluvial_total,
-    generate_alluvial_reuse
-)
-from .generate_graph import generate_graph
-from .plot_all import plot_all
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .gis_export import export_geodata
+    from .timeseries import generate_plots
+    from .maps import generate_system_maps, generate_maps, use_agg
+    from .chord import generate_chord
+    from .alluvial import (generate_alluvial, generate_alluvial_total,
+                           generate_alluvial_reuse, write_figure)
+    from .graph import generate_graph
+    from .cli import plot_all
+
+# The plotting modules pull in matplotlib, plotly and geopandas, so they are
+# only imported when one of their functions is first accessed (PEP 562).
+# Submodule names differ from the function names, so importing a submodule
+# never shadows a function on the package.
+_LAZY_IMPORTS = {
+    "export_geodata": ".gis_export",
+    "generate_plots": ".timeseries",
+    "generate_system_maps": ".maps",
+    "generate_maps": ".maps",
+    "use_agg": ".maps",
+    "generate_chord": ".chord",
+    "generate_alluvial": ".alluvial",
+    "generate_alluvial_total": ".alluvial",
+    "generate_alluvial_reuse": ".alluvial",
+    "write_figure": ".alluvial",
+    "generate_graph": ".graph",
+    "plot_all": ".cli"
+}
 
 __all__ = [
     "export_geodata",
@@ -23,4 +43,12 @@ __all__ = [
     "generate_alluvial_reuse",
     "generate_graph",
     "plot_all"
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,17 +1,23 @@
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 import numpy as np
 import pandas as pd
 from pycirclize import Circos
 
 from duwcm.postprocess import calculate_flow_matrix, calculate_reuse_flow_matrix
 
-def generate_chord(results: Dict[str, pd.DataFrame], flow_paths: pd.DataFrame, output_dir: Path) -> None:
-    """Generate a chord diagram showing water flows between components."""
+def generate_chord(results: Dict[str, pd.DataFrame], flow_paths: pd.DataFrame, output_dir: Path,
+                   flow_matrix: Optional[pd.DataFrame] = None,
+                   reuse_matrix: Optional[pd.DataFrame] = None) -> None:
+    """Generate a chord diagram showing water flows between components.
+
+    Precomputed flow matrices are not modified, so callers can share them.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    flow_matrix = calculate_flow_matrix(results, flow_paths)
-    flow_matrix[flow_matrix != 0] = np.log10(flow_matrix[flow_matrix != 0]) + 1e-10
+    if flow_matrix is None:
+        flow_matrix = calculate_flow_matrix(results, flow_paths)
+    flow_matrix = _log_scale(flow_matrix)
 
     # Initialize from matrix
     circos = Circos.initialize_from_matrix(
@@ -27,8 +33,9 @@ def generate_chord(results: Dict[str, pd.DataFrame], flow_paths: pd.DataFrame, o
     circos.savefig(filename)
 
 
-    flow_matrix = calculate_reuse_flow_matrix(results)
-    flow_matrix[flow_matrix != 0] = np.log10(flow_matrix[flow_matrix != 0]) + 1e-10
+    if reuse_matrix is None:
+        reuse_matrix = calculate_reuse_flow_matrix(results)
+    flow_matrix = _log_scale(reuse_matrix)
 
     # Initialize from matrix
     circos = Circos.initialize_from_matrix(
@@ -41,4 +48,12 @@ def generate_chord(results: Dict[str, pd.DataFrame], flow_paths: pd.DataFrame, o
     )
 
     filename = output_dir / 'reuse_chord.png'
-    circos.savefig(filename)
\ No newline at end of file
+    circos.savefig(filename)
+
+def _log_scale(flow_matrix: pd.DataFrame) -> pd.DataFrame:
+    """Return a copy of the matrix with its non-zero entries on a log10 scale."""
+    values = flow_matrix.to_numpy(dtype=float, copy=True)
+    nonzero = values != 0
+    np.log10(values, out=values, where=nonzero)
+    values[nonzero] += 1e-10
+    return pd.DataFrame(values, index=flow_matrix.index, columns=flow_matrix.columns)
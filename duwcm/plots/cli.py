@@ -0,0 +1,61 @@
+import argparse
+from pathlib import Path
+from joblib import cpu_count
+from joblib.externals.loky import ProcessPoolExecutor
+from duwcm.read_data import read_flow_paths
+from duwcm.utils import load_results, load_config
+from duwcm.postprocess import calculate_flow_matrix, calculate_reuse_flow_matrix
+from duwcm.plots.timeseries import generate_plots
+from duwcm.plots.maps import generate_maps, use_agg
+from duwcm.plots.chord import generate_chord
+from duwcm.plots.alluvial import generate_alluvial_total, generate_alluvial_reuse
+from duwcm.plots.graph import generate_graph
+
+def plot_all():
+    parser = argparse.ArgumentParser(description="Generate plots from simulation results")
+    parser.add_argument("--config", required=True, help="Path to the configuration file")
+    parser.add_argument("--env", default="default", help="Environment to use within the config file")
+    parser.add_argument("--results", required=True, help="Path to the simulation results file")
+    args = parser.parse_args()
+
+    config = load_config(args.config, args.env)
+    results = load_results(args.results)
+    total_area = results['groundwater']['area'].iloc[0].sum()
+    results['aggregated'].attrs['total_area'] = total_area
+
+    # Prepare output directories
+    out_base = Path(config.output.output_directory)
+    plot_dir = out_base / 'figures'
+    map_dir = out_base / 'maps'
+    flow_dir = out_base / 'flows'
+    for directory in [plot_dir, map_dir, flow_dir]:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    # Resolve map inputs
+    geo_dir = Path(config.geodata_directory)
+    geo_file = Path(config.input_directory) / Path(config.files.geo_file)
+    background_shapefile = geo_dir / config.files.background_shapefile
+    feature_shapefiles = [geo_dir / shapefile for shapefile in config.files.feature_shapefiles]
+
+    flow_paths = read_flow_paths(config)
+
+    # Flow matrices are computed once and shared by the flow visualizations
+    flow_matrix = calculate_flow_matrix(results, flow_paths)
+    reuse_matrix = calculate_reuse_flow_matrix(results)
+
+    # The figures only share read-only inputs, so each is rendered in its own process
+    tasks = [
+        (generate_plots, (results['aggregated'], results['forcing'], plot_dir), {}),
+        (generate_maps, (background_shapefile, feature_shapefiles, geo_file, results, map_dir, flow_paths), {}),
+        (generate_chord, (results, flow_paths, flow_dir),
+         {'flow_matrix': flow_matrix, 'reuse_matrix': reuse_matrix}),
+        (generate_alluvial_total, (results, flow_paths, flow_dir), {'flow_matrix': flow_matrix}),
+        (generate_alluvial_reuse, (results, flow_dir), {'reuse_matrix': reuse_matrix}),
+        (generate_graph, (results, flow_paths, flow_dir), {'flow_matrix': flow_matrix})
+    ]
+    with ProcessPoolExecutor(max_workers=min(len(tasks), cpu_count()), initializer=use_agg) as executor:
+        futures = [executor.submit(function, *task_args, **kwargs) for function, task_args, kwargs in tasks]
+        for future in futures:
+            future.result()
+
+    print(f'All visualization outputs saved in {out_base}')
\ No newline at end of file
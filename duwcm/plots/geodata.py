@@ -0,0 +1,22 @@
+from functools import lru_cache
+from pathlib import Path
+
+import geopandas as gpd
+
+
+@lru_cache(maxsize=32)
+def read_geodata(path: Path) -> gpd.GeoDataFrame:
+    """Read a vector file once per process. The cached frame is shared, so do not modify it."""
+    return gpd.read_file(path, engine='pyogrio', use_arrow=True)
+
+
+@lru_cache(maxsize=32)
+def read_geodata_in_crs(path: Path, crs_wkt: str) -> gpd.GeoDataFrame:
+    """Read a vector file reprojected to the given CRS, once per (file, CRS) pair.
+
+    The file is returned as read when it is already in that CRS. The cached frame is shared, so do not modify it.
+    """
+    gdf = read_geodata(path)
+    if gdf.crs == crs_wkt:
+        return gdf
+    return gdf.to_crs(crs_wkt)
@@ -6,6 +6,7 @@ import geopandas as gpd
 import pandas as pd
 
 from duwcm.postprocess import extract_local_results
+from duwcm.plots.geodata import read_geodata
 
 def export_geodata(geometry_geopackage: Path, results: Dict[str, pd.DataFrame],
                forcing: pd.DataFrame, output_dir: Path, crs: str, file_format: str = 'gpkg') -> None:
@@ -24,7 +25,7 @@ def export_geodata(geometry_geopackage: Path, results: Dict[str, pd.DataFrame],
     if file_format not in ['gpkg', 'geojson', 'shp']:
         raise ValueError("Format must be either 'shp', 'gpkg' or 'geojson'")
 
-    gdf_geometry = gpd.read_file(geometry_geopackage)
+    gdf_geometry = read_geodata(geometry_geopackage)
     if gdf_geometry.crs != crs:
         warnings.warn(f"CRS mismatch: Input geometry CRS ({gdf_geometry.crs}) does not match "
                       f"specified CRS ({crs}). Using geometry CRS.")
@@ -33,32 +34,31 @@ def export_geodata(geometry_geopackage: Path, results: Dict[str, pd.DataFrame],
     local_results = extract_local_results(results)
     local_results = local_results.map(lambda x: x.magnitude if hasattr(x, 'magnitude') else x)
 
+    # pyogrio with Arrow transfer is considerably faster than the Fiona writer
+    write_options = {'engine': 'pyogrio', 'use_arrow': True}
+
     statistics_file = output_dir / f'statistics_results.{file_format}'
     temporal_file = output_dir / f'temporal_results.{file_format}'
 
-    # Calculate statistical data
-    statistical_data = local_results.groupby(level='cell').agg({
-        'imported_water': ['sum', 'mean', 'max'],
-        'stormwater_runoff': ['sum', 'mean', 'max'],
-        'sewerage_discharge': ['sum', 'mean', 'max'],
-        'evapotranspiration': ['sum', 'mean', 'max'],
-        'baseflow': ['sum', 'mean', 'max'],
-        'deep_seepage': ['sum', 'mean', 'max']
-    })
+    # Calculate statistical data in one grouped pass over the selected columns
+    statistics_columns = ['imported_water', 'stormwater_runoff', 'sewerage_discharge',
+                          'evapotranspiration', 'baseflow', 'deep_seepage']
+    statistical_data = local_results[statistics_columns].groupby(level='cell').agg(['sum', 'mean', 'max'])
     statistical_data.columns = ['_'.join(col).strip() for col in statistical_data.columns.values]
-    statistical_data = statistical_data.reset_index()
 
-    # Merge with geometry and export statistical data
-    gdf_statistical = gdf_geometry[['BlockID', 'geometry']].merge(statistical_data, left_on='BlockID',
-                                                                  right_on='cell', how='left')
+    # BlockID is unique, so the statistics are joined on the index instead of merged
+    gdf_statistical = (gdf_geometry.set_index('BlockID')[['geometry']]
+                       .join(statistical_data, how='left')
+                       .rename_axis('BlockID')
+                       .reset_index())
     gdf_statistical = gpd.GeoDataFrame(gdf_statistical, geometry='geometry', crs=crs)
 
     if file_format == 'gpkg':
-        gdf_statistical.to_file(statistics_file, driver="GPKG", layer="statistics")
+        gdf_statistical.to_file(statistics_file, driver="GPKG", layer="statistics", **write_options)
     elif file_format == 'shp':
-        gdf_statistical.to_file(statistics_file)
+        gdf_statistical.to_file(statistics_file, **write_options)
     elif file_format == 'geojson':
-        gdf_statistical.to_file(statistics_file, driver="GeoJSON")
+        gdf_statistical.to_file(statistics_file, driver="GeoJSON", **write_options)
     else:
         raise ValueError("Format must be either 'shp', 'gpkg' or 'geojson'")
 
@@ -73,10 +73,12 @@ def export_geodata(geometry_geopackage: Path, results: Dict[str, pd.DataFrame],
     gdf_temporal = gpd.GeoDataFrame(gdf_temporal, geometry='geometry', crs=crs)
 
     if file_format == 'gpkg':
-        gdf_temporal.to_file(temporal_file, driver="GPKG", layer="temporal_data")
+        # Geometries repeat for every timestep, so skip building the R-tree index
+        gdf_temporal.to_file(temporal_file, driver="GPKG", layer="temporal_data", SPATIAL_INDEX="NO",
+                             **write_options)
     elif file_format == 'shp':
-        gdf_temporal.to_file(temporal_file)
+        gdf_temporal.to_file(temporal_file, **write_options)
     elif file_format == 'geojson':
-        gdf_temporal.to_file(temporal_file, driver="GeoJSON")
+        gdf_temporal.to_file(temporal_file, driver="GeoJSON", **write_options)
     else:
         raise ValueError("Format must be either 'shp', 'gpkg' or 'geojson'")
@@ -1,5 +1,6 @@
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
+import numpy as np
 import pandas as pd
 
 import matplotlib.pyplot as plt
@@ -8,7 +9,8 @@ import networkx as nx
 from duwcm.data_structures import UrbanWaterData
 from duwcm.postprocess import calculate_flow_matrix
 
-def generate_graph(results: Dict[str, pd.DataFrame], flow_paths: pd.DataFrame, output_dir: Path) -> None:
+def generate_graph(results: Dict[str, pd.DataFrame], flow_paths: pd.DataFrame, output_dir: Path,
+                   flow_matrix: Optional[pd.DataFrame] = None) -> None:
     """Generate a directed graph showing water flows between components."""
     output_dir = Path(output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -35,7 +37,8 @@ def generate_graph(results: Dict[str, pd.DataFrame], flow_paths: pd.DataFrame, o
         'discharge': (0.85,0.8),
     }
 
-    flow_matrix = calculate_flow_matrix(results, flow_paths)
+    if flow_matrix is None:
+        flow_matrix = calculate_flow_matrix(results, flow_paths)
 
     # Create directed graph
     graph = nx.DiGraph()
@@ -45,12 +48,11 @@ def generate_graph(results: Dict[str, pd.DataFrame], flow_paths: pd.DataFrame, o
         if node in flow_matrix.index:
             graph.add_node(node, pos=(x, y))
 
-    # Add edges from flow matrix
-    for source in flow_matrix.index:
-        for target in flow_matrix.columns:
-            flow_value = flow_matrix.loc[source, target]
-            if flow_value > 0:
-                graph.add_edge(source, target, weight=flow_value)
+    # Add edges from the positive entries of the flow matrix
+    matrix = flow_matrix.to_numpy()
+    rows, cols = np.nonzero(matrix > 0)
+    graph.add_weighted_edges_from(zip(flow_matrix.index[rows], flow_matrix.columns[cols],
+                                      matrix[rows, cols]))
 
     plt.figure(figsize=(15, 10))
     pos_nodes = nx.get_node_attributes(graph, 'pos')
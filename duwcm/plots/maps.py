@@ -1,35 +1,37 @@
 from typing import Dict, List, Any, Optional
 from pathlib import Path
+from functools import lru_cache
 from dynaconf import Dynaconf
 
 import numpy as np
 import pandas as pd
 
 import geopandas as gpd
+import shapely
+import matplotlib
 import matplotlib.pyplot as plt
+from joblib import effective_n_jobs
+from joblib.externals.loky import ProcessPoolExecutor
 
+from matplotlib.collections import LineCollection
 from mpl_toolkits.axes_grid1 import make_axes_locatable
-from shapely.geometry import LineString
 
 from duwcm.utils import ureg
 from duwcm.postprocess import extract_local_results
+from duwcm.plots.geodata import read_geodata, read_geodata_in_crs
 
 
 def generate_system_maps(background_shapefile: Path, feature_shapefiles: List[Path],
                          geometry_geopackage: Path, flow_paths: pd.DataFrame,
                          output_dir: Path, config: Dynaconf) -> None:
     """Create maps showing cell IDs, elevation and flow paths with background features."""
-    gdf_geometry = gpd.read_file(geometry_geopackage)
-    gdf_background = gpd.read_file(background_shapefile)
+    gdf_geometry = read_geodata(geometry_geopackage)
+    gdf_background = read_geodata_in_crs(background_shapefile, gdf_geometry.crs.to_wkt())
 
     # Handle different ID column names
     id_col = 'BlockID' if 'BlockID' in gdf_geometry.columns else 'HexID'
     elev_col = 'AvgElev' if 'AvgElev' in gdf_geometry.columns else 'Elev_Avg'
 
-
-    if gdf_background.crs != gdf_geometry.crs:
-        gdf_background = gdf_background.to_crs(gdf_geometry.crs)
-
     # Get selected cells from config
     selected_cells = getattr(config.grid, 'selected_cells', None)
     if selected_cells is not None:
@@ -37,6 +39,11 @@ def generate_system_maps(background_shapefile: Path, feature_shapefiles: List[Pa
     else:
         selected = pd.Series(True, index=gdf_geometry.index)
 
+    # Cell centroids are computed once, vectorized, for the labels and flow paths
+    cell_ids = gdf_geometry[id_col].to_numpy()
+    centroid_x, centroid_y = _centroid_coords(gdf_geometry).T
+    centroid_by_id = _centroids_by_id(cell_ids, centroid_x, centroid_y)
+
     # Map 1: Cell IDs
     _, ax1 = plt.subplots(figsize=(12, 10))
     plot_background_map(ax1, gdf_background, feature_shapefiles, gdf_geometry, selected_cells)
@@ -46,17 +53,14 @@ def generate_system_maps(background_shapefile: Path, feature_shapefiles: List[Pa
     if selected.any():
         gdf_geometry[selected].plot(ax=ax1, color='lightblue', edgecolor='none', alpha=0.3)
 
-    for idx, row in gdf_geometry.iterrows():
-        if selected_cells is None or row[id_col] in selected_cells:
-            centroid = row.geometry.centroid
-            ax1.annotate(str(int(row[id_col])),
-                        (centroid.x, centroid.y),
-                        ha='center', va='center',
-                        fontsize=8, color='black',
-                        bbox={'facecolor': 'white',
-                              'edgecolor': 'none',
-                              'alpha': 0.4,
-                              'pad': 0.5})
+    # Plain text labels skip the annotation arrow handling; the bbox style is shared
+    label_mask = selected.to_numpy()
+    label_bbox = {'facecolor': 'white', 'edgecolor': 'none', 'alpha': 0.4, 'pad': 0.5}
+    for cell_id, x, y in zip(cell_ids[label_mask], centroid_x[label_mask], centroid_y[label_mask]):
+        ax1.text(x, y, str(int(cell_id)),
+                 ha='center', va='center',
+                 fontsize=8, color='black',
+                 bbox=label_bbox)
     ax1.set_title('Cell IDs')
     ax1.axis('off')
     plt.savefig(output_dir / 'cells_map.png', dpi=300, bbox_inches='tight')
@@ -78,11 +82,9 @@ def generate_system_maps(background_shapefile: Path, feature_shapefiles: List[Pa
                       cmap='terrain',
                       alpha=0.7)
 
-    divider = make_axes_locatable(ax2)
-    cax = divider.append_axes("right", size="5%", pad=0.1)
-    sm = plt.cm.ScalarMappable(cmap='terrain', norm=plt.Normalize(vmin=vmin, vmax=vmax))
+    sm = plt.cm.ScalarMappable(cmap=_cmap('terrain'), norm=plt.Normalize(vmin=vmin, vmax=vmax))
     sm.set_array([])
-    cbar = plt.colorbar(sm, cax=cax)
+    cbar = _add_colorbar(ax2, sm, size="5%")
     cbar.set_label('Elevation [m]', rotation=270, labelpad=15)
 
     ax2.set_title('Elevation')
@@ -99,41 +101,33 @@ def generate_system_maps(background_shapefile: Path, feature_shapefiles: List[Pa
     if selected.any():
         gdf_geometry[selected].plot(ax=ax3, color='lightblue', edgecolor='none', alpha=0.3)
 
-    # Draw flow paths using plot_linear approach
-    cell_data = {row[id_col]: row for _, row in gdf_geometry.iterrows()}
-
-    for cell_id, row in cell_data.items():
+    # Collect flow paths between cell centroids
+    down_by_id = dict(zip(flow_paths.index.to_numpy(), flow_paths['down'].to_numpy()))
+    segments = []
+    for cell_id, start in centroid_by_id.items():
         if selected_cells is None or cell_id in selected_cells:
-            downstream_id = flow_paths.loc[cell_id, 'down']
-            if downstream_id in cell_data and downstream_id != 0:
-                # Get center points
-                start_point = row.geometry.centroid
-                end_point = cell_data[downstream_id].geometry.centroid
-                line = LineString([start_point, end_point])
-
-                # Draw line with arrow
-                line_coords = line.xy
-                ax3.plot(line_coords[0], line_coords[1],
-                        color='red', linewidth=1.5, alpha=0.6)
-
-                # Add arrow
-                arrow_pos = 0.5  # Position along the line (0-1)
-                arrow_x = line_coords[0][0] + (line_coords[0][1] - line_coords[0][0]) * arrow_pos
-                arrow_y = line_coords[1][0] + (line_coords[1][1] - line_coords[1][0]) * arrow_pos
-                dx = line_coords[0][1] - line_coords[0][0]
-                dy = line_coords[1][1] - line_coords[1][0]
-                ax3.arrow(arrow_x, arrow_y, dx*0.1, dy*0.1,
-                         head_width=50, head_length=50,
-                         fc='red', ec='red', alpha=0.6)
+            downstream_id = down_by_id.get(cell_id, 0)
+            if downstream_id in centroid_by_id and downstream_id != 0:
+                segments.append((start, centroid_by_id[downstream_id]))
+
+    # Draw all lines as one collection and all arrows with one quiver call
+    if segments:
+        ax3.add_collection(LineCollection(segments, colors='red', linewidths=1.5, alpha=0.6))
+        ax3.autoscale_view()
+
+        starts, ends = np.asarray(segments).transpose(1, 0, 2)
+        arrow_pos = 0.5  # Position along the line (0-1)
+        deltas = ends - starts
+        arrows = starts + deltas * arrow_pos
+        ax3.quiver(arrows[:, 0], arrows[:, 1], deltas[:, 0] * 0.1, deltas[:, 1] * 0.1,
+                   color='red', alpha=0.6, angles='xy', scale_units='xy', scale=1)
 
     # Mark outflow cells
     outflow_cells = flow_paths[flow_paths['down'] == 0].index
-    for cell_id in outflow_cells:
-        if cell_id in cell_data:
-            cell = cell_data[cell_id]
-            centroid = cell.geometry.centroid
-            ax3.plot(centroid.x, centroid.y, 'r*', markersize=15,
-                    label='Outflow point' if cell_id == outflow_cells[0] else "")
+    outflow_points = [centroid_by_id[cell_id] for cell_id in outflow_cells if cell_id in centroid_by_id]
+    if outflow_points:
+        outflow_x, outflow_y = zip(*outflow_points)
+        ax3.plot(outflow_x, outflow_y, 'r*', linestyle='none', markersize=15, label='Outflow point')
 
     if len(outflow_cells) > 0:
         ax3.legend(loc='upper right', bbox_to_anchor=(1.1, 1))
@@ -145,7 +139,8 @@ def generate_system_maps(background_shapefile: Path, feature_shapefiles: List[Pa
 
 def generate_maps(background_shapefile: Path, feature_shapefiles: List[Path],
                   geometry_geopackage: Path, results: Dict[str, pd.DataFrame],
-                  output_dir: Path, flow_paths: pd.DataFrame) -> None:
+                  output_dir: Path, flow_paths: pd.DataFrame, n_jobs: int = 1) -> None:
+    """Create one map per result variable, optionally spread over n_jobs worker processes."""
     variables_to_plot = {
         'evapotranspiration': ('Greens', None),
         'imported_water': ('YlOrRd', None),
@@ -159,6 +154,7 @@ def generate_maps(background_shapefile: Path, feature_shapefiles: List[Path],
 
     local_results = extract_local_results(results)
 
+    tasks = []
     for variable_name, (cmap, paths) in variables_to_plot.items():
         if variable_name == 'vadose_moisture':
             data = local_results['vadose_moisture'].groupby(level='cell').mean()
@@ -168,8 +164,38 @@ def generate_maps(background_shapefile: Path, feature_shapefiles: List[Path],
             data = local_results[variable_name].groupby(level='cell').sum()
 
         output_path = output_dir / f'{variable_name}_map.png'
-        plot_variable(background_shapefile, feature_shapefiles, geometry_geopackage,
-                      data, variable_name, output_path, cmap, flow_paths=paths)
+        tasks.append((data, variable_name, output_path, cmap, paths))
+
+    # Each worker draws the background once and renders its share of the variables
+    n_workers = min(effective_n_jobs(n_jobs), len(tasks))
+    if n_workers <= 1:
+        _plot_variables(background_shapefile, feature_shapefiles, geometry_geopackage, tasks)
+        return
+
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=use_agg) as executor:
+        futures = [executor.submit(_plot_variables, background_shapefile, feature_shapefiles,
+                                   geometry_geopackage, tasks[i::n_workers])
+                   for i in range(n_workers)]
+        for future in futures:
+            future.result()
+
+def _plot_variables(background_shapefile: Path, feature_shapefiles: List[Path],
+                    geometry_geopackage: Path, tasks: List[tuple]) -> None:
+    """Draw the background map once and render each (data, name, path, cmap, flow_paths) task on it."""
+    # The background layers are the same on every map, so they are drawn once
+    gdf_geometry = read_geodata(geometry_geopackage)
+    gdf_background = read_geodata_in_crs(background_shapefile, gdf_geometry.crs.to_wkt())
+    fig, ax = plt.subplots(figsize=(12, 10))
+    plot_background_map(ax, gdf_background, feature_shapefiles, gdf_geometry)
+
+    for data, variable_name, output_path, cmap, paths in tasks:
+        plot_variable(ax, geometry_geopackage, data, variable_name, output_path, cmap, flow_paths=paths)
+
+    plt.close(fig)
+
+def use_agg() -> None:
+    """Select the non-interactive matplotlib backend in a plotting worker process."""
+    matplotlib.use('Agg', force=True)
 
 def plot_linear(ax: plt.Axes, gdf_geometry: gpd.GeoDataFrame, flow_paths: pd.DataFrame,
                 variable_name: str, cmap: str) -> Optional[plt.cm.ScalarMappable]:
@@ -187,58 +213,65 @@ def plot_linear(ax: plt.Axes, gdf_geometry: gpd.GeoDataFrame, flow_paths: pd.Dat
 
     vmin, vmax = runoff_data.min(), runoff_data.max()
     norm = plt.Normalize(vmin=vmin, vmax=vmax)
-    cmap_obj = plt.get_cmap(cmap)
-
-    def get_line_width(value):
-        abs_min, abs_max = min(abs(vmin), abs(vmax)), max(abs(vmin), abs(vmax))
-        return np.interp(abs(value), [abs_min, abs_max], [1.5, 5])
-
-    cell_data = {row[id_col]: row for _, row in gdf_geometry.iterrows()}
-
-    for cell_id, row in cell_data.items():
-        if pd.notna(row[variable_name]):
-            downstream_id = flow_paths.loc[cell_id, 'down']
-            if downstream_id in cell_data:
-                start_point = row.geometry.centroid
-                end_point = cell_data[downstream_id].geometry.centroid
-                line = LineString([start_point, end_point])
-
-                value = row[variable_name]
-                color = cmap_obj(norm(value))
-                linewidth = get_line_width(value)
-                ax.plot(*line.xy, color=color, linewidth=linewidth, solid_capstyle='round')
+    cmap_obj = _cmap(cmap)
+
+    abs_min, abs_max = min(abs(vmin), abs(vmax)), max(abs(vmin), abs(vmax))
+
+    # Pair each cell with its downstream cell by position, dropping cells without
+    # a value or without a downstream cell in the geometry (outlets point to 0)
+    cell_ids = gdf_geometry[id_col].to_numpy()
+    centroids = _centroid_coords(gdf_geometry)
+    values = gdf_geometry[variable_name].to_numpy(dtype=float)
+    downstream_ids = flow_paths['down'].reindex(cell_ids).to_numpy()
+    downstream_pos = pd.Index(cell_ids).get_indexer(downstream_ids)
+    has_edge = ~np.isnan(values) & (downstream_pos >= 0)
+
+    segments = np.stack([centroids[has_edge], centroids[downstream_pos[has_edge]]], axis=1)
+    values = values[has_edge]
+    colors = cmap_obj(norm(values))
+    linewidths = np.interp(np.abs(values), [abs_min, abs_max], [1.5, 5])
+
+    # Draw all segments as a single collection
+    if len(segments):
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=linewidths,
+                                         capstyle='round'))
+        ax.autoscale_view()
 
     sm = plt.cm.ScalarMappable(cmap=cmap_obj, norm=norm)
     sm.set_array([])
     return sm
 
-def plot_variable(background_shapefile: Path, feature_shapefiles: List[Path],
-                  geometry_geopackage: Path, data: pd.Series, variable_name: str,
+def plot_variable(ax: plt.Axes, geometry_geopackage: Path, data: pd.Series, variable_name: str,
                   output_path: Path, cmap: str, flow_paths: Optional[pd.DataFrame] = None) -> None:
-
-    data_values = data.pint.magnitude
-    gdf_geometry = gpd.read_file(geometry_geopackage)
+    """Draw a variable over the background map on ax and save it.
+
+    The variable layers and colorbar are removed again afterwards, so the same
+    background can be reused for the next variable.
+    """
+    base_artists = set(ax.get_children())
+
+    # Strip the units once into a plain float Series for the mapping below
+    quantity = data.pint.quantity
+    unit = quantity.units
+    data_values = pd.Series(np.asarray(quantity.magnitude), index=data.index)
+    # The geometry is read once per process; only the columns the map needs are copied
+    gdf_geometry = read_geodata(geometry_geopackage)
     id_col = 'BlockID' if 'BlockID' in gdf_geometry.columns else 'HexID'
-    elev_col = 'AvgElev' if 'AvgElev' in gdf_geometry.columns else 'Elev_Avg'
+    gdf_geometry = gdf_geometry[[id_col, 'geometry']].copy()
 
-    gdf_geometry[variable_name] = gdf_geometry[id_col].map(data_values)
+    gdf_geometry[variable_name] = data_values.reindex(gdf_geometry[id_col]).to_numpy()
     print(f"Data mapping for {variable_name}:")
     print(f"Non-null values in geometry: {gdf_geometry[variable_name].notna().sum()}")
     print(f"Data range in geometry: {gdf_geometry[variable_name].min():.1f} to {gdf_geometry[variable_name].max():.1f}")
     print(f"Original data range: {data_values.min():.1f} to {data_values.max():.1f}")
 
-    gdf_background = gpd.read_file(background_shapefile)
-    if gdf_background.crs != gdf_geometry.crs:
-        gdf_background = gdf_background.to_crs(gdf_geometry.crs)
-
-    _, ax = plt.subplots(figsize=(12, 10))
-    plot_background_map(ax, gdf_background, feature_shapefiles, gdf_geometry)
-
     if variable_name in ['stormwater_runoff', 'sewerage_discharge']:
         sm = plot_linear(ax, gdf_geometry, flow_paths, variable_name, cmap)
     else:
-        values = gdf_geometry[variable_name].dropna()
-        if not values.empty:
+        # geopandas skips missing values in column plots, so the mask is only needed for the range
+        column = gdf_geometry[variable_name].to_numpy()
+        values = column[~np.isnan(column)]
+        if values.size:
             if values.mean() < 0:  # Now working with float values
                 cmap = cmap + "_r"
 
@@ -249,13 +282,14 @@ def plot_variable(background_shapefile: Path, feature_shapefiles: List[Path],
                 vmin = center - abs(center) * 0.01  # 1% below
                 vmax = center + abs(center) * 0.01  # 1% above
 
-            sm = plt.cm.ScalarMappable(cmap=cmap, norm=plt.Normalize(vmin=vmin, vmax=vmax))
+            cmap_obj = _cmap(cmap)
+            sm = plt.cm.ScalarMappable(cmap=cmap_obj, norm=plt.Normalize(vmin=vmin, vmax=vmax))
             sm.set_array([])
 
-            gdf_geometry[gdf_geometry[variable_name].notnull()].plot(
+            gdf_geometry.plot(
                 column=variable_name,
                 ax=ax,
-                cmap=cmap,
+                cmap=cmap_obj,
                 alpha=0.5,
                 vmin=vmin,
                 vmax=vmax
@@ -265,15 +299,12 @@ def plot_variable(background_shapefile: Path, feature_shapefiles: List[Path],
     ax.axis('off')
 
     # Format label using the pint unit
-    unit = data.pint.units
     if unit == ureg.meter**3:
         label = fr'{variable_name.replace("_", " ").capitalize()} [m³/yr]'
     else:
         label = fr'{variable_name.replace("_", " ").capitalize()} [{unit:~P}]'
 
-    divider = make_axes_locatable(ax)
-    cax = divider.append_axes("right", size="3%", pad=0.1)
-    cbar = plt.colorbar(sm, cax=cax)
+    cbar = _add_colorbar(ax, sm, size="3%")
     cbar.formatter.set_powerlimits((0, 0))
     cbar.ax.yaxis.set_offset_position('right')
     cbar.ax.yaxis.offsetText.set_fontsize(8)
@@ -281,9 +312,35 @@ def plot_variable(background_shapefile: Path, feature_shapefiles: List[Path],
     cbar.update_ticks()
     cbar.set_label(label, rotation=270, labelpad=15)
 
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    fig = ax.get_figure()
+    fig.tight_layout()
+    fig.savefig(output_path, dpi=300, bbox_inches='tight')
+
+    # Restore the background-only map
+    for artist in ax.get_children():
+        if artist not in base_artists:
+            artist.remove()
+    cbar.ax.remove()
+    ax.set_axes_locator(None)
+
+def _centroid_coords(gdf: gpd.GeoDataFrame) -> np.ndarray:
+    """Return the (N, 2) centroid coordinates of all geometries in one vectorized call."""
+    return shapely.get_coordinates(shapely.centroid(gdf.geometry.values))
+
+def _centroids_by_id(cell_ids: np.ndarray, centroid_x: np.ndarray,
+                     centroid_y: np.ndarray) -> Dict[Any, tuple]:
+    """Index centroid coordinates by cell ID."""
+    return dict(zip(cell_ids, zip(centroid_x, centroid_y)))
+
+@lru_cache(maxsize=None)
+def _cmap(name: str):
+    """Look up a colormap once per name."""
+    return plt.get_cmap(name)
+
+def _add_colorbar(ax: plt.Axes, sm: plt.cm.ScalarMappable, size: str):
+    """Attach a colorbar in an axes appended to the right of the map."""
+    cax = make_axes_locatable(ax).append_axes("right", size=size, pad=0.1)
+    return plt.colorbar(sm, cax=cax)
 
 def plot_background_map(ax: plt.Axes, gdf_background: gpd.GeoDataFrame,
                        feature_shapefiles: List[Path], gdf_geometry: gpd.GeoDataFrame,
@@ -294,10 +351,9 @@ def plot_background_map(ax: plt.Axes, gdf_background: gpd.GeoDataFrame,
     id_col = 'BlockID' if 'BlockID' in gdf_geometry.columns else 'HexID'
     elev_col = 'AvgElev' if 'AvgElev' in gdf_geometry.columns else 'Elev_Avg'
 
+    crs_wkt = gdf_geometry.crs.to_wkt()
     for shapefile in feature_shapefiles:
-        gdf_feature = gpd.read_file(shapefile)
-        if gdf_feature.crs != gdf_geometry.crs:
-            gdf_feature = gdf_feature.to_crs(gdf_geometry.crs)
+        gdf_feature = read_geodata_in_crs(shapefile, crs_wkt)
         if 'Rivers' in str(shapefile):
             gdf_feature.plot(ax=ax, color='dodgerblue', edgecolor='dodgerblue', alpha=0.8, linewidth=1)
         else:
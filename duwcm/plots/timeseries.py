@@ -16,7 +16,7 @@ def generate_plots(results: pd.DataFrame, forcing: pd.DataFrame, output_dir: Pat
         output_dir (Path): Directory to save the output figures
 
     Returns:
-        None (saves PDF and PGF files for each plot)
+        None (saves a PNG file for each plot)
     """
     custom_params = {"axes.spines.bottom": False, "axes.spines.top": False,
                      "axes.spines.right": False, "axes.spines.left": False}
@@ -81,42 +81,44 @@ def generate_plots(results: pd.DataFrame, forcing: pd.DataFrame, output_dir: Pat
     # Save the figure
     base_filename = output_dir / 'evapotranspiration'
     plt.savefig(f"{base_filename}.png", format='png', dpi=300, bbox_inches='tight')
-#    plt.savefig(f"{base_filename}.pdf", format='pdf', dpi=300, bbox_inches='tight')
     plt.close(fig)
 
+    # Precipitation and evapotranspiration are the same on every config plot, so they
+    # are drawn once and only the config series on the secondary axis is replaced
+    fig, ax1 = plt.subplots(figsize=(fig_width_inch, fig_height_inch))
+    ax1.set_xlabel("Time")
+    ax1.xaxis.set_major_locator(mdates.MonthLocator(interval=3))
+    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%b\n%Y'))
+
+    ax1.fill_between(index, 0, plot_data['Precipitation'], color='C0',
+                     alpha=0.5,linewidth=0.1, label='Precipitation')
+    ax1.plot(index, plot_data['Evapotranspiration'], linestyle='--', linewidth=lw,
+             color='C4', label='Evapotranspiration')
+    ax1.set_ylabel(r"Precipitation & Evapotranspiration [mm/day]")
+    ax1.invert_yaxis()
+    lines, labels = ax1.get_legend_handles_labels()
+
+    ax2 = ax1.twinx()
+    # Format with scientific notation
+    ax2.ticklabel_format(style='sci', axis='y', scilimits=(0,0))
+    ax2.yaxis.offsetText.set_fontsize(8)
+    ax2.yaxis.offsetText.set_position((1.05, 1.0))
+
     for i, config in enumerate(plot_configs):
-        fig, ax1 = plt.subplots(figsize=(fig_width_inch, fig_height_inch))
-        ax1.set_xlabel("Time")
-        ax1.xaxis.set_major_locator(mdates.MonthLocator(interval=3))
-        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%b\n%Y'))
-
-        ax1.fill_between(index, 0, plot_data['Precipitation'], color='C0',
-                         alpha=0.5,linewidth=0.1, label='Precipitation')
-        ax1.plot(index, plot_data['Evapotranspiration'], linestyle='--', linewidth=lw,
-                 color='C4', label='Evapotranspiration')
-        ax1.set_ylabel(r"Precipitation & Evapotranspiration [mm/day]")
-        ax1.invert_yaxis()
-
-        ax2 = ax1.twinx()
         config_color = color_cycle[(i+1) % len(color_cycle)]
-        ax2.plot(index, plot_data[config], color=config_color, linewidth=lw, label=config)
+        line, = ax2.plot(index, plot_data[config], color=config_color, linewidth=lw, label=config)
+        ax2.relim()
+        ax2.autoscale_view()
         ax2.set_ylabel(fr"{config} [$\mathrm{{m}}^3$/day]")
 
-        # Format with scientific notation
-        ax2.ticklabel_format(style='sci', axis='y', scilimits=(0,0))
-        ax2.yaxis.offsetText.set_fontsize(8)
-        ax2.yaxis.offsetText.set_position((1.05, 1.0))
-
         plt.tight_layout()
 
-        lines, labels = ax1.get_legend_handles_labels()
-        lines2, labels2 = ax2.get_legend_handles_labels()
         # Modified legend positioning
-        ax2.legend(lines + lines2, labels + labels2, loc='upper center',
+        ax2.legend(lines + [line], labels + [config], loc='upper center',
                   bbox_to_anchor=(0.5, 1.15), ncol=3, frameon=False)
 
         # Save the figure
         base_filename = output_dir / config.lower()
-        plt.savefig(f"{base_filename}.png", format='png', dpi=300, bbox_inches='tight')
-#        plt.savefig(f"{base_filename}.pdf", format='pdf', dpi=300, bbox_inches='tight')
-        plt.close(fig)
+        fig.savefig(f"{base_filename}.png", format='png', dpi=300, bbox_inches='tight')
+        line.remove()
+    plt.close(fig)
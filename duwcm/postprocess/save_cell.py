@@ -15,7 +15,7 @@ def save_cell():
     results = load_results(args.results)
     output_dir = Path(config.output.output_directory) / 'point'
 
-    cell_data = {}
+    cell_frames = {}
 
     for module, df in results.items():
         if module == 'forcing':
@@ -25,19 +25,19 @@ def save_cell():
 
         if isinstance(df.index, pd.MultiIndex):
             try:
-                cell_df = df.xs(args.cell_id, level='cell')
-                for column in cell_df.columns:
-                    cell_data[f"{module}_{column}"] = cell_df[column]
+                cell_frames[module] = df.xs(args.cell_id, level='cell')
             except KeyError:
                 print(f"Warning: Cell ID {args.cell_id} not found in module '{module}'. Skipping.")
         else:
             print(f"Warning: Module '{module}' does not have a MultiIndex structure. Skipping.")
 
-    if not cell_data:
+    if not cell_frames:
         print(f"No data found for cell ID {args.cell_id}")
         return
 
-    cell_results = pd.DataFrame(cell_data)
+    # Combine all modules in one concat and flatten the headers to module_column
+    cell_results = pd.concat(cell_frames, axis=1)
+    cell_results.columns = [f"{module}_{column}" for module, column in cell_results.columns]
 
     # Ensure the output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
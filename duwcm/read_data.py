@@ -210,6 +210,9 @@ def create_flow_paths(urban_data: pd.DataFrame, direction: int) -> pd.DataFrame:
     flow_paths_df = flow_paths_df.fillna(0)
     flow_paths_df.set_index(0, inplace=True)
 
+    # Every column holds a cell ID (0 = none), so int32 is enough
+    flow_paths_df = flow_paths_df.astype(np.int32)
+
     if direction == 8:
         flow_paths_df.columns = ['down', 'u1', 'u2', 'u3', 'u4', 'u5', 'u6', 'u7', 'u8']
     elif direction == 6:
@@ -219,17 +222,26 @@ def create_flow_paths(urban_data: pd.DataFrame, direction: int) -> pd.DataFrame:
 
     return flow_paths_df
 
+def read_urban_data(config: Dynaconf) -> pd.DataFrame:
+    """Read the UrbanBEATS output indexed by BlockID."""
+    dbf = Dbf5(os.path.join(config.input_directory, config.files.urban_beats), codec="windows-1252") #codec='utf-8')
+    urban_data = dbf.to_dataframe()
+    urban_data.rename(columns={"HexID": "BlockID"}, inplace=True)
+    urban_data.set_index('BlockID', inplace=True)
+    urban_data.fillna(0, inplace=True)
+    return urban_data
+
+def read_flow_paths(config: Dynaconf) -> pd.DataFrame:
+    """Read only the flow paths, without preparing the model parameters."""
+    return create_flow_paths(read_urban_data(config), config.grid.direction)
+
 def read_data(config: Dynaconf) -> Tuple[Dict[int, Dict[str, Dict[str, float]]], pd.DataFrame, pd.DataFrame]:
     """Read and process required data files."""
     input_dir = config.input_directory
     files = config.files
 
     # Read data files
-    dbf = Dbf5(os.path.join(input_dir, files.urban_beats), codec="windows-1252") #codec='utf-8')
-    urban_data = dbf.to_dataframe()
-    urban_data.rename(columns={"HexID": "BlockID"}, inplace=True)
-    urban_data.set_index('BlockID', inplace=True)
-    urban_data.fillna(0, inplace=True)
+    urban_data = read_urban_data(config)
 
     altwater_data = pd.read_csv(os.path.join(input_dir, files.alternative_water))
     altwater_data.loc[len(altwater_data)] = np.zeros(len(altwater_data.columns))
@@ -22,11 +22,11 @@ Parameters for both scenarios are configurable through thresholds:
 """
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Tuple
 from copy import deepcopy
 
 import logging
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, parallel_config
 from dynaconf import Dynaconf
 import pandas as pd
 
@@ -219,10 +219,14 @@ class ScenarioManager:
     def run_scenarios(self, model_data: Dict, base_params: Dict, base_forcing: pd.DataFrame,
                       tracker: DiagnosticTracker, n_jobs: int = -1) -> Dict[str, Dict[str, pd.DataFrame]]:
         """Run scenarios in parallel"""
-        # Prepare scenario parameters as a list
-        scenario_names = []
-        scenario_params = []
+        return dict(self.iter_scenarios(model_data, base_params, base_forcing, tracker, n_jobs))
 
+    def iter_scenarios(self, model_data: Dict, base_params: Dict, base_forcing: pd.DataFrame,
+                       tracker: DiagnosticTracker, n_jobs: int = -1) -> Iterator[Tuple[str, Dict[str, pd.DataFrame]]]:
+        """Run scenarios in parallel, yielding (name, results) in order of completion.
+
+        With a diagnostic tracker, results are yielded only after all scenarios have finished.
+        """
         if is_notebook():
             backend = 'threading'
             progress = True
@@ -233,22 +237,28 @@ class ScenarioManager:
             backend = 'loky'
             progress = False
 
-        for idx, (name, scenario) in enumerate(self.scenarios.items()):
-            scenario_names.append(name)
-            modified_params = scenario.modify_params(base_params)
-            modified_forcing = scenario.modify_forcing(base_forcing)
-            scenario_params.append((name, modified_params, modified_forcing,
-                                    model_data, tracker, idx, progress))
-
-        # Run scenarios in parallel while preserving argument structure
-        results_list = Parallel(n_jobs=n_jobs, backend=backend, verbose=0)(
-            delayed(run_scenario)(params) for params in scenario_params
+        # Scenario inputs are built lazily, as joblib dispatches them
+        scenario_params = (
+            (name, scenario.modify_params(base_params), scenario.modify_forcing(base_forcing),
+             model_data, tracker, idx, progress)
+            for idx, (name, scenario) in enumerate(self.scenarios.items())
         )
 
-        # Directly map results to scenario names
-        results = dict(results_list)
-
-        return results
+        # Scenarios are few and long-running: dispatch them one per batch and only
+        # build inputs for the scenarios about to run.
+        # Loky workers also cap their BLAS/OpenMP pools at one thread each, so the
+        # scenario processes do not oversubscribe the cores.
+        with parallel_config(backend=backend,
+                             inner_max_num_threads=1 if backend == 'loky' else None):
+            parallel = Parallel(n_jobs=n_jobs, verbose=0, return_as='generator_unordered',
+                                batch_size=1, pre_dispatch='2*n_jobs')
+        results = parallel(delayed(run_scenario)(params) for params in scenario_params)
+
+        # A shared tracker is appended to by every scenario thread, so its history is
+        # only complete once all scenarios have finished: do not stream in that case
+        if tracker is not None:
+            results = list(results)
+        yield from results
 
 
 def run_scenario(scenario_data):
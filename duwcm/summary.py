@@ -1,23 +1,25 @@
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional
 import pandas as pd
 
 from duwcm.postprocess.flow_matrix import calculate_flow_matrix
 
 def write_summary(results: Dict[str, pd.DataFrame], flow_paths: pd.DataFrame,
-                  output_file: Path) -> None:
+                  output_file: Path, flow_matrix: Optional[pd.DataFrame] = None) -> None:
     """
     Generate a summary of total water balance components using results data.
 
     Args:
         results (Dict[str, pd.DataFrame]): Dictionary containing simulation results
         output_file (Path): Path to save the summary file
+        flow_matrix (pd.DataFrame, optional): Precomputed component flow matrix
 
     Returns:
         None
     """
 
-    flow_matrix = calculate_flow_matrix(results, flow_paths)
+    if flow_matrix is None:
+        flow_matrix = calculate_flow_matrix(results, flow_paths)
 
     # Write summary to file
     with open(output_file, 'w', encoding="utf8") as f:
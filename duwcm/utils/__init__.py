@@ -1,11 +1,12 @@
 # duwcm/functions/__init__.py
 
-from .load_files import load_config, load_results
+from .load_files import load_config, load_results, save_results
 from .units import BaseUnit, ureg
 from .misc import is_notebook
 
 __all__ = [
     "load_config",
     "load_results",
+    "save_results",
     "is_notebook"
 ]
\ No newline at end of file
@@ -1,11 +1,29 @@
-from typing import Dict
+import os
+import json
+from typing import Dict, Optional
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
 import pandas as pd
+import pint_pandas
 from dynaconf import Dynaconf
 import yaml
 
+# PyTables chunk cache settings for the results file (64 MiB, prime slot count).
+# open_file takes them as lowercase keywords; unknown names are silently ignored.
+# The Blosc thread count is set per call by save_results.
+HDF5_PARAMS = {
+    'chunk_cache_size': 64 << 20,
+    'chunk_cache_nelmts': 100003,
+    'chunk_cache_preempt': 1.0
+}
+
 def load_results(results_file: Path) -> Dict[str, pd.DataFrame]:
     results_file = Path(results_file)
+    if results_file.is_dir():
+        return {path.stem: pd.read_parquet(path, engine='pyarrow')
+                for path in sorted(results_file.glob('*.parquet'))}
     if not results_file.is_file():
         raise FileNotFoundError(f"Results file not found: {results_file}")
 
@@ -15,7 +33,86 @@ def load_results(results_file: Path) -> Dict[str, pd.DataFrame]:
             results[key.strip('/')] = store.select(key)
     return results
 
-def load_config(config_path: str | Path, env: str = "default", base_config: str = "config.yaml") -> Dynaconf:
+def save_results(results: Dict[str, pd.DataFrame], results_file: Path,
+                 file_format: str = 'h5', float32: bool = False,
+                 n_threads: Optional[int] = None) -> None:
+    """
+    Save simulation results to an HDF5 file or a directory of Parquet files.
+
+    Empty modules are not written. Pint columns are stored as plain
+    magnitudes and their units are kept as JSON in the 'units_json'
+    attribute of each HDF5 key, or in the 'units' schema metadata of
+    each Parquet file.
+
+    Args:
+        results: Dictionary of result DataFrames keyed by module name
+        results_file: Path to the output HDF5 file, or to the output
+            directory with one '<module>.parquet' file per module
+        file_format: 'h5' or 'parquet'
+        float32: Store float64 magnitudes as float32 to halve the file size
+        n_threads: Threads used for compression and writing; defaults to all
+            cores. Pass 1 when several processes save at the same time.
+    """
+    n_threads = n_threads or os.cpu_count() or 1
+
+    # Resolve the units of every module before anything is written; empty
+    # modules carry no data and are skipped
+    write_plan = [
+        (module, df, {col: str(dtype.units) for col, dtype in df.dtypes.items()
+                      if isinstance(dtype, pint_pandas.PintType)})
+        for module, df in results.items() if not df.empty
+    ]
+
+    if file_format == 'parquet':
+        _save_parquet(write_plan, Path(results_file), float32, n_threads)
+    elif file_format == 'h5':
+        _save_hdf5(write_plan, results_file, float32, n_threads)
+    else:
+        raise ValueError(f"Unknown results format: {file_format}")
+
+def _to_regular(df: pd.DataFrame, float32: bool) -> pd.DataFrame:
+    """Convert a Pint DataFrame to a regular one, optionally as float32."""
+    df_regular = df.pint.dequantify().droplevel('unit', axis=1)
+    if float32:
+        float_cols = df_regular.select_dtypes('float64').columns
+        df_regular = df_regular.astype({col: 'float32' for col in float_cols})
+    return df_regular
+
+def _save_hdf5(write_plan: list, results_file: Path, float32: bool, n_threads: int) -> None:
+    """Write every module to one HDF5 store in a single session."""
+    with pd.HDFStore(results_file, mode='w', complib='blosc:zstd', complevel=3,
+                     max_blosc_threads=n_threads, **HDF5_PARAMS) as store:
+        for module, df, units_dict in write_plan:
+            df_regular = _to_regular(df, float32)
+            store.put(module, df_regular, format='fixed', track_times=False)
+            if units_dict:
+                store.get_storer(module).attrs.units_json = json.dumps(units_dict)
+
+def _save_parquet(write_plan: list, results_dir: Path, float32: bool, n_threads: int) -> None:
+    """Write each module to its own zstd-compressed Parquet file, concurrently."""
+    results_dir.mkdir(parents=True, exist_ok=True)
+
+    # Files are independent and pyarrow releases the GIL while encoding and writing
+    with ThreadPoolExecutor(max_workers=max(1, min(len(write_plan), 4, n_threads))) as executor:
+        futures = [executor.submit(_write_parquet, results_dir / f'{module}.parquet',
+                                   df, units_dict, float32)
+                   for module, df, units_dict in write_plan]
+        for future in futures:
+            future.result()
+
+def _write_parquet(parquet_file: Path, df: pd.DataFrame, units_dict: dict, float32: bool) -> None:
+    """Write one module with its units as JSON schema metadata."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    df_regular = _to_regular(df, float32)
+
+    table = pa.Table.from_pandas(df_regular)
+    metadata = {**(table.schema.metadata or {}), b'units': json.dumps(units_dict).encode()}
+    pq.write_table(table.replace_schema_metadata(metadata), parquet_file, compression='zstd')
+
+def load_config(config_path: str | Path, env: str = "default", base_config: str = "config.yaml",
+                settings: Optional[Dynaconf] = None) -> Dynaconf:
     """
     Load configuration from YAML file with optional environment selection.
 
@@ -23,14 +120,14 @@ def load_config(config_path: str | Path, env: str = "default", base_config: str
         config_path: Path to configuration directory
         env: Environment name in the YAML file
         base_config: Name of base config file
+        settings: Existing configuration to overlay the file onto. It is cloned
+            first, so the caller's settings are left unchanged
 
     Returns:
         Dynaconf: Configuration object with loaded settings
     """
-    base_dir = Path(config_path)
-
-    with open(base_dir / base_config, 'r', encoding='utf-8') as f:
-        yaml_config = yaml.safe_load(f)
+    config_file = Path(config_path) / base_config
+    yaml_config = deepcopy(_read_yaml(config_file, config_file.stat().st_mtime_ns))
 
     # If the env exists in the base config, use it
     if env in yaml_config:
@@ -39,8 +136,28 @@ def load_config(config_path: str | Path, env: str = "default", base_config: str
         _deep_merge(base_settings, env_settings)
         yaml_config = base_settings
 
+    if settings is not None:
+        overlay = settings.dynaconf_clone()
+        overlay.update(yaml_config)
+        return overlay
+
     return Dynaconf(settings_files=False, env=env, **yaml_config)
 
+@lru_cache(maxsize=32)
+def _read_yaml(config_file: Path, mtime_ns: int) -> dict:
+    """
+    Parse a YAML file, caching the result until the file is modified.
+
+    Args:
+        config_file: Path to the YAML file
+        mtime_ns: Modification time of the file, used to invalidate the cache
+
+    Returns:
+        dict: Parsed YAML content (must not be modified by callers)
+    """
+    with open(config_file, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
 def _deep_merge(base: dict, update: dict) -> None:
     """
     Recursively merge two dictionaries, modifying the base dictionary.
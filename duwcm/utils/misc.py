@@ -1,5 +1,8 @@
+from functools import lru_cache
 from IPython import get_ipython
-def is_notebook():
+
+@lru_cache(maxsize=1)
+def is_notebook() -> bool:
     try:
         return get_ipython().__class__.__name__ == "ZMQInteractiveShell"
     except NameError:
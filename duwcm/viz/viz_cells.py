@@ -21,7 +21,7 @@ def interactive_cell_selection(config, geo_file, background_file, flow_paths):
     selection_output = widgets.Output()
 
     def create_selectable_map():
-        gdf_geometry = gpd.read_file(geo_file)
+        gdf_geometry = gpd.read_file(geo_file, engine='pyogrio', use_arrow=True)
         fig = create_map_base(geo_file, background_file, flow_paths)
 
         # Set proper customdata for selection
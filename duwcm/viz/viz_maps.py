@@ -7,8 +7,8 @@ import plotly.graph_objects as go
 def create_map_base(geometry_geopackage: Path, background_shapefile: Path,
                     flow_paths: pd.DataFrame) -> go.Figure:
     """Create base map with hexagonal grid, background, elevation and flow paths."""
-    gdf_geometry = gpd.read_file(geometry_geopackage)
-    gdf_background = gpd.read_file(background_shapefile)
+    gdf_geometry = gpd.read_file(geometry_geopackage, engine='pyogrio', use_arrow=True)
+    gdf_background = gpd.read_file(background_shapefile, engine='pyogrio', use_arrow=True)
 
     if gdf_geometry.crs != gdf_background.crs:
         gdf_background = gdf_background.to_crs(gdf_geometry.crs)
@@ -57,16 +57,19 @@ def create_map_base(geometry_geopackage: Path, background_shapefile: Path,
     lines_lons = []
     lines_lats = []
 
-    cell_data = {row['BlockID']: row for _, row in gdf_geometry.iterrows()}
-    for cell_id, row in cell_data.items():
-        downstream_id = flow_paths.loc[cell_id, 'down']
-        if downstream_id in cell_data and downstream_id != 0:
-            start_point = row.geometry.centroid
-            end_point = cell_data[downstream_id].geometry.centroid
+    # Centroids are computed in one vectorized call and looked up by cell ID
+    centroids = gdf_geometry.geometry.centroid
+    centroid_by_id = dict(zip(gdf_geometry['BlockID'].to_numpy(),
+                              zip(centroids.x.to_numpy(), centroids.y.to_numpy())))
+    down_by_id = dict(zip(flow_paths.index.to_numpy(), flow_paths['down'].to_numpy()))
+    for cell_id, (start_x, start_y) in centroid_by_id.items():
+        downstream_id = down_by_id[cell_id]
+        if downstream_id in centroid_by_id and downstream_id != 0:
+            end_x, end_y = centroid_by_id[downstream_id]
 
             # Add to lines
-            lines_lons.extend([start_point.x, end_point.x, None])
-            lines_lats.extend([start_point.y, end_point.y, None])
+            lines_lons.extend([start_x, end_x, None])
+            lines_lats.extend([start_y, end_y, None])
 
     # Add single trace for all flow paths
     fig.add_trace(go.Scattermapbox(
@@ -165,7 +168,7 @@ def create_dynamic_map(gdf_geometry: gpd.GeoDataFrame, background_shapefile: Pat
 
     fig = go.Figure()
 
-    gdf_background = gpd.read_file(background_shapefile)
+    gdf_background = gpd.read_file(background_shapefile, engine='pyogrio', use_arrow=True)
     if gdf_geometry.crs != gdf_background.crs:
         gdf_background = gdf_background.to_crs(gdf_geometry.crs)
     gdf_background = gdf_background.to_crs(epsg=4326)